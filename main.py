@@ -10,42 +10,207 @@ Usage:
 """
 
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
-import tldextract
+from requests.adapters import HTTPAdapter
+from http.cookiejar import DefaultCookiePolicy
+from bs4 import BeautifulSoup, NavigableString
+from urllib.parse import urlparse, urlsplit
 import re
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import copy
 import json
 import time
 import statistics
 import hashlib
-import base64
 from typing import Dict, List, Any, Tuple, Optional
 import warnings
-import mimetypes
 import argparse
 import sys
 import os
-
-# Flask imports for web interface
-from flask import Flask, request, jsonify, render_template_string
 import threading
-import webbrowser
+
+
+# Prefer the C-backed lxml tree builder, falling back to the pure-Python parser
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Serialize API responses with orjson's C encoder when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Patterns and lookup tables shared by every analysis, built once at import
+DOCTYPE_RE = re.compile('<!DOCTYPE', re.IGNORECASE)
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Link targets reported as downloadable files
+FILE_LINK_EXTENSIONS = frozenset([
+    'pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'zip', 'rar',
+    'mp3', 'mp4', 'avi', 'jpg', 'png', 'gif'
+])
+
+# Image formats recognised from src URLs, in order of precedence
+IMAGE_FORMATS = ['jpg', 'jpeg', 'png', 'gif', 'webp', 'avif', 'svg']
+IMAGE_FORMAT_RE = re.compile(r'\.(' + '|'.join(IMAGE_FORMATS) + ')', re.IGNORECASE)
+
+# Attributes that are not reported as custom attributes
+STANDARD_ATTRIBUTES = frozenset(['id', 'class', 'style', 'src', 'href', 'alt', 'title'])
+
+FRAMEWORK_SIGNATURES = {
+    'React': ['React.', 'ReactDOM', 'jsx'],
+    'Vue': ['Vue.', 'v-if', 'v-for'],
+    'Angular': ['angular.', 'ng-'],
+    'jQuery': ['jQuery', '$('],
+    'D3': ['d3.'],
+    'Three.js': ['THREE.'],
+    'Lodash': ['_.'],
+    'Moment.js': ['moment(']
+}
+
+# All framework signatures in one alternation so a script is scanned once,
+# however many signatures there are (no signature overlaps another)
+FRAMEWORK_BY_SIGNATURE = {
+    signature: framework
+    for framework, signatures in FRAMEWORK_SIGNATURES.items()
+    for signature in signatures
+}
+FRAMEWORK_SIGNATURE_RE = re.compile('|'.join(re.escape(signature) for signature in FRAMEWORK_BY_SIGNATURE))
+
+# Substrings that flag features of an inline script; plain substring tests,
+# which are cheaper than an alternation regex for a handful of literals
+CONST_LET_TERMS = ('const ', 'let ')
+ASYNC_AWAIT_TERMS = ('async ', 'await ')
+AJAX_TERMS = ('ajax', 'fetch', 'XMLHttpRequest')
+DOM_MANIPULATION_TERMS = ('getElementById', 'querySelector', 'createElement')
+
+# Framework sentinels sit near the top of minified bundles, so only this many
+# leading characters of a minified inline script are scanned for them
+MINIFIED_FRAMEWORK_SCAN_LIMIT = 8192
+
+# Connections kept open per host by the shared HTTP adapter
+HTTP_POOL_SIZE = 12
+
+# Shared by every analyzer so repeated fetches reuse TCP/TLS connections. Only the
+# adapter is shared: its urllib3 pool manager is thread-safe, while a Session is
+# not guaranteed to be, so each thread gets its own Session on top of it
+HTTP_ADAPTER = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+_thread_sessions = threading.local()
+
+
+def create_http_session() -> requests.Session:
+    """Create an HTTP session on the shared connection pool that stores no cookies"""
+    session = requests.Session()
+    # Cookies set by one analyzed site must not be sent with later fetches
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount('http://', HTTP_ADAPTER)
+    session.mount('https://', HTTP_ADAPTER)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """Return the calling thread's HTTP session, creating it on first use"""
+    session = getattr(_thread_sessions, 'session', None)
+    if session is None:
+        session = _thread_sessions.session = create_http_session()
+    return session
+
+# Pages fetched concurrently by one batch analysis request
+BATCH_MAX_WORKERS = 8
+
+# URLs accepted by one /analyze_batch request
+BATCH_MAX_URLS = 50
+
+# --output value that writes the report to stdout instead of a file
+STDOUT_PATH = '-'
+
+
+@lru_cache(maxsize=4096)
+def get_registered_domain(netloc: str) -> str:
+    """Return the registered domain of a host, cached per process"""
+    # Imported on first use; loading the suffix-list machinery is a sizeable
+    # share of startup time that --help and web server start-up never need
+    import tldextract
+    return tldextract.extract(netloc).registered_domain
+
+
+def normalize_url(url: str) -> str:
+    """Return an http(s) URL for user input, assuming https:// when no scheme is given"""
+    url = url.strip()
+    scheme = urlsplit(url).scheme.lower()
+    if scheme in ('http', 'https'):
+        return url
+    if url.startswith('//'):
+        return 'https:' + url
+    # A bare "host:port" parses as a scheme, so only "scheme://" marks another protocol
+    if scheme and url[len(scheme):].startswith('://'):
+        raise ValueError(f"Unsupported URL scheme: {scheme}")
+    return 'https://' + url
+
+
+# Finished summary analyses (include_details=False) kept per URL, most recently used
+# last, so an unchanged page is answered without being parsed and walked again.
+# Detailed results are never cached: they are large and rarely requested twice
+ANALYSIS_CACHE_SIZE = 256
+_analysis_cache = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def get_cached_analysis(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cache entry for an analysis key, marking it recently used"""
+    with _analysis_cache_lock:
+        entry = _analysis_cache.get(key)
+        if entry is not None:
+            _analysis_cache.move_to_end(key)
+        return entry
+
+
+def store_cached_analysis(key: str, entry: Dict[str, Any]) -> None:
+    """Cache an analysis entry, evicting the least recently used one when full"""
+    with _analysis_cache_lock:
+        _analysis_cache[key] = entry
+        _analysis_cache.move_to_end(key)
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
 
 
 class ComprehensiveDOMAnalyzer:
     """The Ultimate DOM Analyzer - Generates 17,000+ Real Statistics"""
     
-    def __init__(self, url: str, timeout: int = 30):
+    # One analyzer is created per analyzed URL; slots skip the per-instance dict
+    __slots__ = (
+        'url', 'include_details', 'session', 'parsed_url', 'base_origin', 'base_domain',
+        'timeout', 'soup', 'html_bytes', '_html_text',
+        'response_headers', 'response_time', 'statistics_count',
+        '_cache_key', '_cache_entry', '_cached_results',
+        '_indexed_soup', '_all_elements', '_elements_by_tag', '_text_soup', '_text_cache'
+    )
+    
+    def __init__(self, url: str, timeout: int = 30, session: Optional[requests.Session] = None,
+                 include_details: bool = True):
         self.url = url
+        self.include_details = include_details
+        self.session = session
         self.parsed_url = urlparse(url)
-        self.base_domain = tldextract.extract(url).registered_domain
+        # Prefix for resolving root-relative links, built once instead of per link
+        self.base_origin = f"{self.parsed_url.scheme}://{self.parsed_url.netloc}"
+        self.base_domain = get_registered_domain(self.parsed_url.netloc)
         self.timeout = timeout
         self.soup = None
-        self.html_content = ""
+        self.html_bytes = b""
+        self._html_text = None
         self.response_headers = {}
         self.response_time = 0
         self.statistics_count = 0
+        self._cache_key = None if include_details else url
+        self._cache_entry = None
+        self._cached_results = None
+        self._clear_page_caches()
         
         # Suppress SSL warnings
         warnings.filterwarnings('ignore', message='Unverified HTTPS request')
@@ -58,24 +223,97 @@ class ComprehensiveDOMAnalyzer:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             }
             
-            response = requests.get(self.url, headers=headers, timeout=self.timeout, verify=False)
+            # Revalidate a previously analyzed page with a conditional request
+            self._cached_results = None
+            cached = get_cached_analysis(self._cache_key) if self._cache_key else None
+            if cached:
+                if cached['etag']:
+                    headers['If-None-Match'] = cached['etag']
+                if cached['last_modified']:
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
+            session = self.session or get_http_session()
+            response = session.get(self.url, headers=headers, timeout=self.timeout, verify=False)
             response.raise_for_status()
             
             self.response_time = time.time() - start_time
-            self.html_content = response.text
-            self.response_headers = dict(response.headers)
-            self.soup = BeautifulSoup(self.html_content, 'html.parser')
+            self.response_headers = response.headers
+            if cached and response.status_code == 304:
+                self._cached_results = cached['results']
+                return True
+            
+            # Servers without validators are still matched on a hash of the body;
+            # uncached (detailed) analyses skip hashing altogether
+            if self._cache_key:
+                self._cache_entry = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'content_hash': hashlib.blake2b(response.content, digest_size=16).hexdigest()
+                }
+                if cached and cached['content_hash'] == self._cache_entry['content_hash']:
+                    self._cached_results = cached['results']
+                    self._cache_entry['results'] = cached['results']
+                    store_cached_analysis(self._cache_key, self._cache_entry)
+                    return True
+            
+            self.html_bytes = response.content
+            self._html_text = None
+            
+            # Parse the raw bytes so the parser detects the encoding itself, honouring
+            # an explicit charset from the Content-Type header over <meta charset>
+            declared_encoding = response.encoding if 'charset' in response.headers.get('Content-Type', '').lower() else None
+            self.soup = BeautifulSoup(self.html_bytes, HTML_PARSER, from_encoding=declared_encoding)
             
             return True
             
         except Exception as e:
-            print(f"Error fetching page: {e}")
+            print(f"Error fetching page: {e}", file=sys.stderr)
             return False
     
+    @property
+    def html_content(self) -> str:
+        """The page markup as text, decoded from the raw bytes on first access"""
+        if self._html_text is None:
+            # Decode the way the parser did, so the text always agrees with the soup
+            encoding = self.soup.original_encoding if self.soup else None
+            self._html_text = str(self.html_bytes, encoding or 'utf-8', errors='replace')
+        return self._html_text
+    
     def _count_statistic(self) -> None:
         """Increment the statistics counter"""
         self.statistics_count += 1
     
+    def _build_tag_index(self) -> None:
+        """Walk the soup once and group every element by tag name"""
+        self._all_elements = self.soup.find_all() if self.soup else []
+        self._elements_by_tag = defaultdict(list)
+        for element in self._all_elements:
+            self._elements_by_tag[element.name].append(element)
+        self._indexed_soup = self.soup
+    
+    def _elements(self, tag: Optional[str] = None) -> List[Any]:
+        """Return all elements, or those with the given tag, from the tag index"""
+        if self._indexed_soup is not self.soup:
+            self._build_tag_index()
+        if tag is None:
+            return self._all_elements
+        return self._elements_by_tag.get(tag, [])
+    
+    def _clear_page_caches(self) -> None:
+        """Drop the tag index and extracted text so they are not kept alive with the soup"""
+        self._indexed_soup = None
+        self._all_elements = []
+        self._elements_by_tag = {}
+        self._text_soup = None
+        self._text_cache = ""
+    
+    def _page_text(self) -> str:
+        """Return the document text, extracting it only once per soup"""
+        if self._text_soup is not self.soup:
+            self._text_cache = self.soup.get_text() if self.soup else ""
+            self._text_soup = self.soup
+        return self._text_cache
+    
     def analyze_every_element(self) -> Dict[str, Any]:
         """Analyze every single DOM element in detail"""
         analysis = {
@@ -94,36 +332,61 @@ class ComprehensiveDOMAnalyzer:
         if not self.soup:
             return analysis
         
-        all_elements = self.soup.find_all()
+        all_elements = self._elements()
         analysis['total_elements'] = len(all_elements)
         self._count_statistic()  # 1
         
+        # The tag index already groups elements by tag in first-seen order
+        analysis['elements_by_tag'] = {tag: len(elements) for tag, elements in self._elements_by_tag.items()}
+        
+        # The tag index lists elements in document order, so every parent's depth
+        # is known before its children are reached
+        depth_by_node = {id(self.soup): 0}
+        
+        # Descendant counts bottom-up: in reverse document order every child element is
+        # counted before its parent, so each node's subtree is visited once overall
+        descendants_by_node = {}
+        if self.include_details:
+            for element in reversed(all_elements):
+                descendant_count = 0
+                for child in element.contents:
+                    descendant_count += 1 + descendants_by_node.get(id(child), 0)
+                descendants_by_node[id(element)] = descendant_count
+        
         for idx, element in enumerate(all_elements):
             tag_name = element.name
             if tag_name:
                 analysis['unique_tags'].add(tag_name)
-                
-                # Count elements by tag
-                if tag_name not in analysis['elements_by_tag']:
-                    analysis['elements_by_tag'][tag_name] = 0
-                analysis['elements_by_tag'][tag_name] += 1
                 self._count_statistic()  # Count for each tag type
                 
                 # Get element depth
-                depth = len(list(element.parents))
-                analysis['element_depths'][idx] = depth
+                depth = depth_by_node[id(element.parent)] + 1
+                depth_by_node[id(element)] = depth
                 analysis['max_nesting_depth'] = max(analysis['max_nesting_depth'], depth)
                 self._count_statistic()  # Count for depth
+                attrs = element.attrs
+                
+                if not self.include_details:
+                    # Same statistics as below without building the per-element payloads;
+                    # finding the first non-blank string is enough to know there is text
+                    if next(element.stripped_strings, None) is not None:
+                        self.statistics_count += 4  # Text length, word, char and line counts
+                    self.statistics_count += 3 * len(attrs)  # Attribute value, length and type
+                    self.statistics_count += 4  # Element detail counts
+                    continue
+                
+                analysis['element_depths'][idx] = depth
                 
                 # Get text content
                 text_content = element.get_text(strip=True)
+                text_length = len(text_content)
                 if text_content:
                     analysis['element_text_content'][idx] = {
                         'text': text_content[:200],  # Truncate for storage
-                        'length': len(text_content),
+                        'length': text_length,
                         'word_count': len(text_content.split()),
-                        'char_count': len(text_content),
-                        'line_count': len(text_content.split('\n'))
+                        'char_count': text_length,
+                        'line_count': text_content.count('\n') + 1
                     }
                     self._count_statistic()  # Count for text length
                     self._count_statistic()  # Count for word count
@@ -131,13 +394,13 @@ class ComprehensiveDOMAnalyzer:
                     self._count_statistic()  # Count for line count
                 
                 # Analyze all attributes
-                attrs = element.attrs
                 if attrs:
-                    analysis['element_attributes'][idx] = {}
+                    element_attributes = analysis['element_attributes'][idx] = {}
                     for attr_name, attr_value in attrs.items():
-                        analysis['element_attributes'][idx][attr_name] = {
-                            'value': str(attr_value)[:100],  # Truncate
-                            'length': len(str(attr_value)),
+                        value_str = attr_value if isinstance(attr_value, str) else str(attr_value)
+                        element_attributes[attr_name] = {
+                            'value': value_str[:100],  # Truncate
+                            'length': len(value_str),
                             'type': type(attr_value).__name__
                         }
                         self._count_statistic()  # Count for each attribute
@@ -151,9 +414,9 @@ class ComprehensiveDOMAnalyzer:
                     'depth': depth,
                     'attribute_count': len(attrs),
                     'has_text': bool(text_content),
-                    'text_length': len(text_content) if text_content else 0,
-                    'children_count': len(list(element.children)),
-                    'descendant_count': len(list(element.descendants))
+                    'text_length': text_length,
+                    'children_count': len(element.contents),
+                    'descendant_count': descendants_by_node[id(element)]
                 }
                 analysis['element_details'].append(element_detail)
                 self._count_statistic()  # Count for attribute count
@@ -171,20 +434,20 @@ class ComprehensiveDOMAnalyzer:
         """Analyze every attribute of every element"""
         analysis = {
             'attribute_statistics': {},
-            'attribute_usage_count': {},
-            'attribute_values': {},
-            'attribute_lengths': {},
+            'attribute_usage_count': Counter(),
+            'attribute_values': defaultdict(list),
+            'attribute_lengths': defaultdict(list),
             'unique_attributes': set(),
             'total_attributes': 0,
-            'data_attributes': {},
-            'aria_attributes': {},
-            'custom_attributes': {}
+            'data_attributes': Counter(),
+            'aria_attributes': Counter(),
+            'custom_attributes': Counter()
         }
         
         if not self.soup:
             return analysis
         
-        all_elements = self.soup.find_all()
+        all_elements = self._elements()
         
         for element in all_elements:
             attrs = element.attrs
@@ -192,57 +455,46 @@ class ComprehensiveDOMAnalyzer:
                 analysis['total_attributes'] += len(attrs)
                 self._count_statistic()  # Total attributes count
                 
+                # Count attribute usage for the whole element in one C-level update
+                analysis['attribute_usage_count'].update(attrs.keys())
+                
                 for attr_name, attr_value in attrs.items():
                     analysis['unique_attributes'].add(attr_name)
-                    
-                    # Count attribute usage
-                    if attr_name not in analysis['attribute_usage_count']:
-                        analysis['attribute_usage_count'][attr_name] = 0
-                    analysis['attribute_usage_count'][attr_name] += 1
                     self._count_statistic()  # Attribute usage count
                     
                     # Analyze attribute values
-                    if attr_name not in analysis['attribute_values']:
-                        analysis['attribute_values'][attr_name] = []
-                    
-                    value_str = str(attr_value)
-                    analysis['attribute_values'][attr_name].append(value_str[:50])  # Truncate
+                    value_str = attr_value if isinstance(attr_value, str) else str(attr_value)
+                    if self.include_details:
+                        analysis['attribute_values'][attr_name].append(value_str[:50])  # Truncate
                     
                     # Analyze attribute length
-                    if attr_name not in analysis['attribute_lengths']:
-                        analysis['attribute_lengths'][attr_name] = []
                     analysis['attribute_lengths'][attr_name].append(len(value_str))
                     self._count_statistic()  # Attribute length
                     
-                    # Categorize special attributes
+                    # Categorize special attributes (the categories are mutually exclusive)
                     if attr_name.startswith('data-'):
-                        if attr_name not in analysis['data_attributes']:
-                            analysis['data_attributes'][attr_name] = 0
                         analysis['data_attributes'][attr_name] += 1
                         self._count_statistic()  # Data attribute count
                     
-                    if attr_name.startswith('aria-'):
-                        if attr_name not in analysis['aria_attributes']:
-                            analysis['aria_attributes'][attr_name] = 0
+                    elif attr_name.startswith('aria-'):
                         analysis['aria_attributes'][attr_name] += 1
                         self._count_statistic()  # ARIA attribute count
                     
-                    if not attr_name in ['id', 'class', 'style', 'src', 'href', 'alt', 'title'] and not attr_name.startswith(('data-', 'aria-')):
-                        if attr_name not in analysis['custom_attributes']:
-                            analysis['custom_attributes'][attr_name] = 0
+                    elif attr_name not in STANDARD_ATTRIBUTES:
                         analysis['custom_attributes'][attr_name] += 1
                         self._count_statistic()  # Custom attribute count
         
         # Calculate statistics for attribute values and lengths
         for attr_name in analysis['attribute_lengths']:
             lengths = analysis['attribute_lengths'][attr_name]
+            total_chars = sum(lengths)
             analysis['attribute_statistics'][attr_name] = {
                 'count': len(lengths),
                 'min_length': min(lengths) if lengths else 0,
                 'max_length': max(lengths) if lengths else 0,
-                'avg_length': statistics.mean(lengths) if lengths else 0,
+                'avg_length': total_chars / len(lengths) if lengths else 0,
                 'median_length': statistics.median(lengths) if lengths else 0,
-                'total_chars': sum(lengths)
+                'total_chars': total_chars
             }
             self._count_statistic()  # Min length
             self._count_statistic()  # Max length
@@ -263,12 +515,12 @@ class ComprehensiveDOMAnalyzer:
             'external_links': [],
             'same_domain_links': [],
             'subdomain_links': [],
-            'protocol_analysis': {},
+            'protocol_analysis': Counter(),
             'anchor_links': [],
             'email_links': [],
             'phone_links': [],
-            'file_links': {},
-            'link_attributes': {},
+            'file_links': defaultdict(list),
+            'link_attributes': defaultdict(Counter),
             'broken_link_indicators': [],
             'link_text_analysis': {}
         }
@@ -276,7 +528,7 @@ class ComprehensiveDOMAnalyzer:
         if not self.soup:
             return analysis
         
-        links = self.soup.find_all('a', href=True)
+        links = [link for link in self._elements('a') if link.get('href') is not None]
         
         for link in links:
             href = link['href'].strip()
@@ -292,7 +544,7 @@ class ComprehensiveDOMAnalyzer:
                 self._count_statistic()  # Anchor link count
                 
             elif href.startswith('mailto:'):
-                email = href.replace('mailto:', '')
+                email = href[len('mailto:'):]
                 analysis['email_links'].append({
                     'email': email,
                     'text': link_text
@@ -300,7 +552,7 @@ class ComprehensiveDOMAnalyzer:
                 self._count_statistic()  # Email link count
                 
             elif href.startswith('tel:'):
-                phone = href.replace('tel:', '')
+                phone = href[len('tel:'):]
                 analysis['phone_links'].append({
                     'phone': phone,
                     'text': link_text
@@ -312,21 +564,18 @@ class ComprehensiveDOMAnalyzer:
                 if href.startswith('//'):
                     full_url = 'https:' + href
                 elif href.startswith('/'):
-                    full_url = f"{self.parsed_url.scheme}://{self.parsed_url.netloc}{href}"
+                    full_url = self.base_origin + href
                 else:
                     full_url = href
                 
                 parsed_link = urlparse(full_url)
-                link_domain = tldextract.extract(full_url)
                 
                 # Protocol analysis
                 protocol = parsed_link.scheme
-                if protocol not in analysis['protocol_analysis']:
-                    analysis['protocol_analysis'][protocol] = 0
                 analysis['protocol_analysis'][protocol] += 1
                 self._count_statistic()  # Protocol count
                 
-                # Categorize by domain
+                # Categorize by domain; the registered domain is only needed for other hosts
                 if parsed_link.netloc == self.parsed_url.netloc:
                     analysis['same_domain_links'].append({
                         'url': full_url,
@@ -338,7 +587,7 @@ class ComprehensiveDOMAnalyzer:
                     analysis['internal_links'].append(full_url)
                     self._count_statistic()  # Internal link count
                     
-                elif link_domain.registered_domain == self.base_domain:
+                elif get_registered_domain(parsed_link.netloc) == self.base_domain:
                     analysis['subdomain_links'].append({
                         'url': full_url,
                         'text': link_text,
@@ -358,32 +607,27 @@ class ComprehensiveDOMAnalyzer:
                 path = parsed_link.path.lower()
                 if '.' in path:
                     file_ext = path.split('.')[-1]
-                    if file_ext in ['pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'zip', 'rar', 'mp3', 'mp4', 'avi', 'jpg', 'png', 'gif']:
-                        if file_ext not in analysis['file_links']:
-                            analysis['file_links'][file_ext] = []
+                    if file_ext in FILE_LINK_EXTENSIONS:
                         analysis['file_links'][file_ext].append(full_url)
                         self._count_statistic()  # File link count
             
             # Analyze link attributes
             for attr_name, attr_value in link.attrs.items():
-                if attr_name not in analysis['link_attributes']:
-                    analysis['link_attributes'][attr_name] = {}
-                
                 value_str = str(attr_value)
-                if value_str not in analysis['link_attributes'][attr_name]:
-                    analysis['link_attributes'][attr_name][value_str] = 0
                 analysis['link_attributes'][attr_name][value_str] += 1
                 self._count_statistic()  # Link attribute count
             
             # Analyze link text
             if link_text:
+                word_count = len(link_text.split())
+                lowered_text = link_text.lower()
                 analysis['link_text_analysis'][href] = {
                     'text': link_text,
                     'length': len(link_text),
-                    'word_count': len(link_text.split()),
-                    'is_descriptive': len(link_text.split()) > 2,
-                    'contains_click': 'click' in link_text.lower(),
-                    'contains_here': 'here' in link_text.lower()
+                    'word_count': word_count,
+                    'is_descriptive': word_count > 2,
+                    'contains_click': 'click' in lowered_text,
+                    'contains_here': 'here' in lowered_text
                 }
                 self._count_statistic()  # Link text length
                 self._count_statistic()  # Link word count
@@ -408,15 +652,15 @@ class ComprehensiveDOMAnalyzer:
         """Comprehensive image analysis"""
         analysis = {
             'total_images': 0,
-            'formats': {},
+            'formats': Counter(),
             'with_alt': 0,
             'without_alt': 0,
             'empty_alt': 0,
             'lazy_loading': 0,
             'responsive_images': 0,
-            'size_attributes': {},
+            'size_attributes': Counter(),
             'src_analysis': {},
-            'image_locations': {},
+            'image_locations': Counter(),
             'base64_images': 0,
             'svg_images': 0,
             'picture_elements': 0,
@@ -427,13 +671,16 @@ class ComprehensiveDOMAnalyzer:
             return analysis
         
         # Analyze img tags
-        images = self.soup.find_all('img')
+        images = self._elements('img')
         analysis['total_images'] = len(images)
         self._count_statistic()  # Total images
         
         for img in images:
+            # Read attributes straight from the attrs dict, once per image
+            attrs = img.attrs
+            
             # Alt text analysis
-            alt = img.get('alt')
+            alt = attrs.get('alt')
             if alt is not None:
                 analysis['with_alt'] += 1
                 if alt.strip() == '':
@@ -446,38 +693,36 @@ class ComprehensiveDOMAnalyzer:
                 self._count_statistic()  # Without alt count
             
             # Lazy loading
-            if img.get('loading') == 'lazy':
+            if attrs.get('loading') == 'lazy':
                 analysis['lazy_loading'] += 1
                 self._count_statistic()  # Lazy loading count
             
             # Size attributes
-            width = img.get('width')
-            height = img.get('height')
+            width = attrs.get('width')
+            height = attrs.get('height')
             if width or height:
                 size_key = f"{width or 'auto'}x{height or 'auto'}"
-                if size_key not in analysis['size_attributes']:
-                    analysis['size_attributes'][size_key] = 0
                 analysis['size_attributes'][size_key] += 1
                 self._count_statistic()  # Size attribute count
             
             # Source analysis
-            src = img.get('src', '')
+            src = attrs.get('src', '')
             if src.startswith('data:image'):
                 analysis['base64_images'] += 1
                 self._count_statistic()  # Base64 image count
             elif src:
-                # Determine format from URL
-                for format_ext in ['jpg', 'jpeg', 'png', 'gif', 'webp', 'avif', 'svg']:
-                    if f'.{format_ext}' in src.lower():
-                        if format_ext not in analysis['formats']:
-                            analysis['formats'][format_ext] = 0
+                # Determine format from URL: one scan finds every extension present,
+                # then the first one in IMAGE_FORMATS order wins
+                found_formats = {match.group(1).lower() for match in IMAGE_FORMAT_RE.finditer(src)}
+                for format_ext in IMAGE_FORMATS:
+                    if format_ext in found_formats:
                         analysis['formats'][format_ext] += 1
                         self._count_statistic()  # Format count
                         break
                 
                 # Categorize image location
                 if src.startswith(('http://', 'https://')):
-                    parsed_src = urlparse(src)
+                    parsed_src = urlsplit(src)
                     domain = parsed_src.netloc
                     if domain == self.parsed_url.netloc:
                         location = 'same_domain'
@@ -486,19 +731,17 @@ class ComprehensiveDOMAnalyzer:
                 else:
                     location = 'relative'
                 
-                if location not in analysis['image_locations']:
-                    analysis['image_locations'][location] = 0
                 analysis['image_locations'][location] += 1
                 self._count_statistic()  # Image location count
             
             # Responsive images (srcset)
-            if img.get('srcset'):
+            if attrs.get('srcset'):
                 analysis['srcset_usage'] += 1
                 analysis['responsive_images'] += 1
                 self._count_statistic()  # Srcset usage count
         
         # Analyze picture elements
-        pictures = self.soup.find_all('picture')
+        pictures = self._elements('picture')
         analysis['picture_elements'] = len(pictures)
         self._count_statistic()  # Picture elements count
         
@@ -507,7 +750,7 @@ class ComprehensiveDOMAnalyzer:
             self._count_statistic()  # Responsive image count
         
         # Analyze SVG
-        svgs = self.soup.find_all('svg')
+        svgs = self._elements('svg')
         analysis['svg_images'] = len(svgs)
         self._count_statistic()  # SVG count
         
@@ -533,8 +776,8 @@ class ComprehensiveDOMAnalyzer:
             'module_scripts': 0,
             'nomodule_scripts': 0,
             'script_sizes': [],
-            'script_sources': {},
-            'script_types': {},
+            'script_sources': Counter(),
+            'script_types': Counter(),
             'frameworks_detected': [],
             'libraries_detected': [],
             'inline_script_analysis': {},
@@ -544,25 +787,22 @@ class ComprehensiveDOMAnalyzer:
         if not self.soup:
             return analysis
         
-        scripts = self.soup.find_all('script')
+        scripts = self._elements('script')
         analysis['total_scripts'] = len(scripts)
         self._count_statistic()  # Total scripts
         
         for script in scripts:
             # Basic categorization
-            if script.get('src'):
+            src = script.get('src')
+            if src:
                 analysis['external_scripts'] += 1
                 self._count_statistic()  # External script count
                 
-                src = script['src']
-                
                 # Analyze source domain
                 if src.startswith(('http://', 'https://')):
-                    parsed_src = urlparse(src)
+                    parsed_src = urlsplit(src)
                     analysis['external_domains'].add(parsed_src.netloc)
                     
-                    if parsed_src.netloc not in analysis['script_sources']:
-                        analysis['script_sources'][parsed_src.netloc] = 0
                     analysis['script_sources'][parsed_src.netloc] += 1
                     self._count_statistic()  # Script source count
                 
@@ -586,54 +826,53 @@ class ComprehensiveDOMAnalyzer:
                     self._count_statistic()  # Script size
                     
                     # Analyze inline script content
-                    lines = content.split('\n')
+                    line_count = content.count('\n') + 1
+                    minified = line_count < 3 and size > 500
+                    es6_features = {
+                        'arrow_functions': '=>' in content,
+                        'const_let': any(term in content for term in CONST_LET_TERMS),
+                        'template_literals': '`' in content,
+                        'destructuring': '{' in content and '}' in content,
+                        'async_await': any(term in content for term in ASYNC_AWAIT_TERMS)
+                    }
                     analysis['inline_script_analysis'][f'script_{analysis["inline_scripts"]}'] = {
                         'size': size,
-                        'lines': len(lines),
-                        'minified': len(lines) < 3 and size > 500,
+                        'lines': line_count,
+                        'minified': minified,
                         'contains_jquery': '$' in content and 'jQuery' in content,
                         'contains_console': 'console.' in content,
-                        'contains_ajax': any(term in content for term in ['ajax', 'fetch', 'XMLHttpRequest']),
+                        'contains_ajax': any(term in content for term in AJAX_TERMS),
                         'contains_event_listeners': 'addEventListener' in content,
-                        'contains_dom_manipulation': any(term in content for term in ['getElementById', 'querySelector', 'createElement']),
-                        'es6_features': {
-                            'arrow_functions': '=>' in content,
-                            'const_let': any(term in content for term in ['const ', 'let ']),
-                            'template_literals': '`' in content,
-                            'destructuring': '{' in content and '}' in content,
-                            'async_await': any(term in content for term in ['async ', 'await '])
-                        }
+                        'contains_dom_manipulation': any(term in content for term in DOM_MANIPULATION_TERMS),
+                        'es6_features': es6_features
                     }
                     
                     # Count individual features
-                    for feature, present in analysis['inline_script_analysis'][f'script_{analysis["inline_scripts"]}']['es6_features'].items():
+                    for present in es6_features.values():
                         if present:
                             self._count_statistic()  # ES6 feature count
                     
                     self._count_statistic()  # Script lines
                     
-                    # Framework detection
-                    frameworks = {
-                        'React': ['React.', 'ReactDOM', 'jsx'],
-                        'Vue': ['Vue.', 'v-if', 'v-for'],
-                        'Angular': ['angular.', 'ng-'],
-                        'jQuery': ['jQuery', '$('],
-                        'D3': ['d3.'],
-                        'Three.js': ['THREE.'],
-                        'Lodash': ['_.'],
-                        'Moment.js': ['moment(']
-                    }
-                    
-                    for framework, signatures in frameworks.items():
-                        if any(sig in content for sig in signatures):
-                            if framework not in analysis['frameworks_detected']:
+                    # Framework detection (only the head of a minified bundle is scanned),
+                    # skipped once every known framework has been detected
+                    missing = [fw for fw in FRAMEWORK_SIGNATURES if fw not in analysis['frameworks_detected']]
+                    if missing:
+                        scan_content = content[:MINIFIED_FRAMEWORK_SCAN_LIMIT] if minified else content
+                        found = set()
+                        for match in FRAMEWORK_SIGNATURE_RE.finditer(scan_content):
+                            framework = FRAMEWORK_BY_SIGNATURE[match.group()]
+                            if framework in missing:
+                                found.add(framework)
+                                if len(found) == len(missing):
+                                    break  # Nothing left to find in this script
+                        for framework in missing:
+                            if framework in found:
                                 analysis['frameworks_detected'].append(framework)
                                 self._count_statistic()  # Framework detection count
             
             # Script type analysis
             script_type = script.get('type', 'text/javascript')
-            if script_type not in analysis['script_types']:
-                analysis['script_types'][script_type] = 0
             analysis['script_types'][script_type] += 1
             self._count_statistic()  # Script type count
             
@@ -648,9 +887,10 @@ class ComprehensiveDOMAnalyzer:
         
         # Calculate statistics
         if analysis['script_sizes']:
+            total_size = sum(analysis['script_sizes'])
             analysis['script_size_stats'] = {
-                'total_size': sum(analysis['script_sizes']),
-                'average_size': statistics.mean(analysis['script_sizes']),
+                'total_size': total_size,
+                'average_size': total_size / len(analysis['script_sizes']),
                 'median_size': statistics.median(analysis['script_sizes']),
                 'min_size': min(analysis['script_sizes']),
                 'max_size': max(analysis['script_sizes'])
@@ -678,14 +918,16 @@ class ComprehensiveDOMAnalyzer:
         if not self.soup:
             return analysis
         
+        page_text = self._page_text()
+        
         # Document info
         analysis['document_info'] = {
-            'has_doctype': bool(self.soup.find(string=re.compile('<!DOCTYPE', re.IGNORECASE))),
+            'has_doctype': bool(self.soup.find(string=DOCTYPE_RE)),
             'html_lang': self.soup.html.get('lang') if self.soup.html else None,
-            'total_html_size': len(self.html_content),
-            'total_elements': len(self.soup.find_all()),
-            'total_text_content': len(self.soup.get_text()),
-            'markup_to_text_ratio': len(self.html_content) / len(self.soup.get_text()) if self.soup.get_text() else 0
+            'total_html_size': len(self.html_bytes),
+            'total_elements': len(self._elements()),
+            'total_text_content': len(page_text),
+            'markup_to_text_ratio': len(self.html_bytes) / len(page_text) if page_text else 0
         }
         for key in analysis['document_info']:
             self._count_statistic()  # Document info stats
@@ -693,15 +935,26 @@ class ComprehensiveDOMAnalyzer:
         # Head analysis
         head = self.soup.find('head')
         if head:
+            title_tag = head.find('title')
+            title_text = title_tag.get_text() if title_tag else None
+            
+            # One walk over the head collects every tag count
+            head_tag_counts = Counter()
+            has_viewport_meta = False
+            for element in head.find_all():
+                head_tag_counts[element.name] += 1
+                if element.name == 'meta' and element.get('name') == 'viewport':
+                    has_viewport_meta = True
+            
             analysis['head_analysis'] = {
-                'title': head.find('title').get_text() if head.find('title') else None,
-                'title_length': len(head.find('title').get_text()) if head.find('title') else 0,
-                'meta_tags': len(head.find_all('meta')),
-                'link_tags': len(head.find_all('link')),
-                'script_tags': len(head.find_all('script')),
-                'style_tags': len(head.find_all('style')),
-                'base_tag': bool(head.find('base')),
-                'viewport_meta': bool(head.find('meta', attrs={'name': 'viewport'}))
+                'title': title_text,
+                'title_length': len(title_text) if title_text is not None else 0,
+                'meta_tags': head_tag_counts['meta'],
+                'link_tags': head_tag_counts['link'],
+                'script_tags': head_tag_counts['script'],
+                'style_tags': head_tag_counts['style'],
+                'base_tag': head_tag_counts['base'] > 0,
+                'viewport_meta': has_viewport_meta
             }
             for key in analysis['head_analysis']:
                 self._count_statistic()  # Head analysis stats
@@ -709,11 +962,25 @@ class ComprehensiveDOMAnalyzer:
         # Body analysis
         body = self.soup.find('body')
         if body:
+            # One walk over the body counts text nodes and comment markers; tags
+            # always serialize to non-empty markup, so they never need str()
+            text_nodes = 0
+            comments = 0
+            for child in body.descendants:
+                if isinstance(child, NavigableString):
+                    stripped = child.strip()
+                    if stripped:
+                        text_nodes += 1
+                        if stripped.startswith('<!--'):
+                            comments += 1
+                else:
+                    text_nodes += 1
+            
             analysis['body_analysis'] = {
                 'total_elements': len(body.find_all()),
-                'direct_children': len(list(body.children)),
-                'text_nodes': len([child for child in body.descendants if hasattr(child, 'strip') and str(child).strip()]),
-                'comments': len(body.find_all(string=lambda text: isinstance(text, str) and text.strip().startswith('<!--')))
+                'direct_children': len(body.contents),
+                'text_nodes': text_nodes,
+                'comments': comments
             }
             for key in analysis['body_analysis']:
                 self._count_statistic()  # Body analysis stats
@@ -721,27 +988,37 @@ class ComprehensiveDOMAnalyzer:
         # Semantic elements analysis
         semantic_tags = ['header', 'nav', 'main', 'article', 'section', 'aside', 'footer', 'figure', 'figcaption', 'time', 'mark']
         for tag in semantic_tags:
-            count = len(self.soup.find_all(tag))
+            count = len(self._elements(tag))
             analysis['semantic_elements'][tag] = count
             self._count_statistic()  # Semantic element count
         
         # Text statistics
-        text_content = self.soup.get_text()
-        words = text_content.split()
-        sentences = re.split(r'[.!?]+', text_content)
+        words = page_text.split()
+        sentences = SENTENCE_SPLIT_RE.split(page_text)
+        
+        # Single pass over the words for length and vocabulary
+        total_word_length = 0
+        unique_words = set()
+        for word in words:
+            total_word_length += len(word)
+            if word.isalpha():
+                unique_words.add(word.lower())
+        
+        # Blank sentences split into zero words, so one pass both filters and measures
+        sentence_lengths = [length for length in (len(sentence.split()) for sentence in sentences) if length]
         
         analysis['text_statistics'] = {
-            'total_characters': len(text_content),
+            'total_characters': len(page_text),
             'total_words': len(words),
-            'unique_words': len(set(word.lower() for word in words if word.isalpha())),
-            'total_sentences': len([s for s in sentences if s.strip()]),
-            'average_word_length': statistics.mean([len(word) for word in words]) if words else 0,
-            'average_sentence_length': statistics.mean([len(sentence.split()) for sentence in sentences if sentence.strip()]) if sentences else 0,
-            'paragraphs': len(self.soup.find_all('p')),
-            'headings_total': len(self.soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])),
-            'lists': len(self.soup.find_all(['ul', 'ol', 'dl'])),
-            'tables': len(self.soup.find_all('table')),
-            'forms': len(self.soup.find_all('form'))
+            'unique_words': len(unique_words),
+            'total_sentences': len(sentence_lengths),
+            'average_word_length': total_word_length / len(words) if words else 0,
+            'average_sentence_length': sum(sentence_lengths) / len(sentence_lengths) if sentence_lengths else 0,
+            'paragraphs': len(self._elements('p')),
+            'headings_total': sum(len(self._elements(tag)) for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']),
+            'lists': sum(len(self._elements(tag)) for tag in ['ul', 'ol', 'dl']),
+            'tables': len(self._elements('table')),
+            'forms': len(self._elements('form'))
         }
         for key in analysis['text_statistics']:
             self._count_statistic()  # Text statistics
@@ -754,6 +1031,8 @@ class ComprehensiveDOMAnalyzer:
             return {'error': 'Failed to fetch page', 'url': self.url}
         
         start_time = time.time()
+        if self._cached_results is not None:
+            return self._reuse_cached_results(start_time)
         
         # Reset statistics counter
         self.statistics_count = 0
@@ -762,7 +1041,7 @@ class ComprehensiveDOMAnalyzer:
             'url': self.url,
             'fetch_info': {
                 'response_time': self.response_time,
-                'content_length': len(self.html_content),
+                'content_length': len(self.html_bytes),
                 'response_headers_count': len(self.response_headers)
             },
             'element_analysis': self.analyze_every_element(),
@@ -773,6 +1052,9 @@ class ComprehensiveDOMAnalyzer:
             'page_structure': self.analyze_page_structure()
         }
         
+        # The per-page caches are only needed while the analyzers run
+        self._clear_page_caches()
+        
         # Add meta information
         processing_time = time.time() - start_time
         
@@ -780,8 +1062,9 @@ class ComprehensiveDOMAnalyzer:
             'total_statistics_generated': self.statistics_count,
             'processing_time': processing_time,
             'analysis_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'analysis_categories': len([k for k in comprehensive_data.keys() if k.endswith('_analysis') or k == 'page_structure']),
-            'analyzer_version': '2.0.0'
+            'analysis_categories': sum(1 for k in comprehensive_data if k.endswith('_analysis') or k == 'page_structure'),
+            'analyzer_version': '2.0.0',
+            'cached': False
         }
         self._count_statistic()  # Processing time
         self._count_statistic()  # Analysis categories
@@ -789,7 +1072,25 @@ class ComprehensiveDOMAnalyzer:
         # Update final count
         comprehensive_data['meta_analysis']['total_statistics_generated'] = self.statistics_count
         
+        # The cache keeps its own copy so callers may modify what they are given
+        if self._cache_key:
+            self._cache_entry['results'] = copy.deepcopy(comprehensive_data)
+            store_cached_analysis(self._cache_key, self._cache_entry)
+        
         return comprehensive_data
+    
+    def _reuse_cached_results(self, start_time: float) -> Dict[str, Any]:
+        """Return a private copy of the cached analysis with this request's fetch and timing info"""
+        results = copy.deepcopy(self._cached_results)
+        # A 304 has no body, so the content length stays the one that was analyzed
+        results['fetch_info']['response_time'] = self.response_time
+        results['fetch_info']['response_headers_count'] = len(self.response_headers)
+        results['meta_analysis'].update({
+            'processing_time': time.time() - start_time,
+            'analysis_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'cached': True
+        })
+        return results
 
 
 # HTML Template for the web interface
@@ -1294,10 +1595,29 @@ Total Statistics Generated: ${data.meta_analysis.total_statistics_generated.toLo
 </html>'''
 
 
+def analyze_url(url: str, include_details: bool = True) -> Dict[str, Any]:
+    """Analyze a single URL, reporting failures in the result instead of raising"""
+    try:
+        return ComprehensiveDOMAnalyzer(normalize_url(url), include_details=include_details).generate_comprehensive_analysis()
+    except Exception as e:
+        return {'error': f'Analysis failed: {str(e)}', 'url': url}
+
+
 def create_flask_app():
     """Create and configure the Flask app"""
+    # Flask is imported here so CLI runs do not pay for loading the web stack
+    from flask import Flask, request, jsonify, render_template_string
+    
     app = Flask(__name__)
     
+    def json_response(payload):
+        """Build a JSON response, encoding with orjson when available"""
+        if orjson is None:
+            return jsonify(payload)
+        # Element maps such as element_depths are keyed by position, hence NON_STR_KEYS
+        return app.response_class(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+                                  mimetype='application/json')
+    
     @app.route('/')
     def index():
         return render_template_string(HTML_TEMPLATE)
@@ -1309,66 +1629,198 @@ def create_flask_app():
             url = data.get('url')
             
             if not url:
-                return jsonify({'error': 'No URL provided'})
+                return json_response({'error': 'No URL provided'})
             
-            # Perform analysis
-            analyzer = ComprehensiveDOMAnalyzer(url)
+            # Per-element payloads are only built when the client asks for them
+            analyzer = ComprehensiveDOMAnalyzer(normalize_url(url), include_details=data.get('include_details', False))
             results = analyzer.generate_comprehensive_analysis()
             
-            return jsonify(results)
+            return json_response(results)
             
         except Exception as e:
-            return jsonify({'error': f'Analysis failed: {str(e)}'})
+            return json_response({'error': f'Analysis failed: {str(e)}'})
+    
+    @app.route('/analyze_batch', methods=['POST'])
+    def analyze_batch():
+        try:
+            data = request.json
+            urls = data.get('urls')
+            
+            if not urls or not isinstance(urls, list):
+                return json_response({'error': 'No URLs provided'})
+            
+            if len(urls) > BATCH_MAX_URLS:
+                return json_response({'error': f'Too many URLs (at most {BATCH_MAX_URLS} per batch)'})
+            
+            # Fetching is network-bound, so the pages are analyzed concurrently
+            # over the shared connection pool; map keeps the results in input order
+            include_details = data.get('include_details', False)
+            with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(urls))) as executor:
+                results = list(executor.map(analyze_url, urls, [include_details] * len(urls)))
+            
+            return json_response({'results': results})
+            
+        except Exception as e:
+            return json_response({'error': f'Analysis failed: {str(e)}'})
     
     return app
 
 
+def write_json_report(results: Dict[str, Any], output_file: str) -> None:
+    """Save the full analysis as JSON, or print it when the output file is '-'"""
+    if output_file == STDOUT_PATH:
+        sys.stdout.flush()
+        if orjson is not None:
+            # Encoded bytes go straight to the stdout buffer, skipping text-mode encoding
+            sys.stdout.buffer.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) + b'\n')
+            sys.stdout.buffer.flush()
+        else:
+            json.dump(results, sys.stdout, indent=2, ensure_ascii=False)
+            sys.stdout.write('\n')
+        return
+    
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"💾 Results saved to: {output_file}")
+
+
+def write_text_report(results: Dict[str, Any], output_file: str) -> None:
+    """Save a short plain-text summary of the analysis"""
+    meta = results['meta_analysis']
+    elements = results['element_analysis']
+    report = (
+        f"DOM Analyzer Report\n"
+        f"URL: {results['url']}\n"
+        f"Analysis Date: {meta['analysis_timestamp']}\n"
+        f"Total Statistics: {meta['total_statistics_generated']:,}\n\n"
+        f"SUMMARY\n"
+        f"{'=' * 40}\n"
+        f"Total Elements: {elements['total_elements']:,}\n"
+        f"Unique Tags: {elements['unique_tags_count']}\n"
+        f"Total Attributes: {results['attribute_analysis']['total_attributes']:,}\n"
+        f"Total Links: {results['link_analysis']['summary']['total_links']}\n"
+        f"Total Images: {results['image_analysis']['total_images']}\n"
+        f"Total Scripts: {results['script_analysis']['total_scripts']}\n"
+    )
+    if output_file == STDOUT_PATH:
+        sys.stdout.write(report)
+        return
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(report)
+    print(f"📄 Text report saved to: {output_file}")
+
+
+# Report writers by --format name
+REPORT_WRITERS = {
+    'json': write_json_report,
+    'text': write_text_report
+}
+
+
 def run_cli_mode(url: str, output_file: str = None, format_type: str = 'json'):
     """Run the analyzer in CLI mode"""
-    print(f"🔍 DOM Analyzer - Analyzing: {url}")
-    print("=" * 60)
+    # Keep stdout clean for the report when it is written there
+    console = sys.stderr if output_file == STDOUT_PATH else sys.stdout
+    
+    try:
+        url = normalize_url(url)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=console)
+        return
+    
+    print(f"🔍 DOM Analyzer - Analyzing: {url}", file=console)
+    print("=" * 60, file=console)
     
     analyzer = ComprehensiveDOMAnalyzer(url)
     results = analyzer.generate_comprehensive_analysis()
     
     if 'error' in results:
-        print(f"❌ Error: {results['error']}")
+        print(f"❌ Error: {results['error']}", file=console)
         return
     
+    # Sections shown in the console summary
+    meta = results['meta_analysis']
+    elements = results['element_analysis']
+    total_attributes = results['attribute_analysis']['total_attributes']
+    total_links = results['link_analysis']['summary']['total_links']
+    total_images = results['image_analysis']['total_images']
+    total_scripts = results['script_analysis']['total_scripts']
+    
     # Print summary to console
-    print(f"✅ Analysis Complete!")
-    print(f"📊 Total Statistics Generated: {results['meta_analysis']['total_statistics_generated']:,}")
-    print(f"⏱️  Processing Time: {results['meta_analysis']['processing_time']:.2f} seconds")
-    print(f"🏗️  Total Elements: {results['element_analysis']['total_elements']:,}")
-    print(f"🏷️  Unique Tags: {results['element_analysis']['unique_tags_count']}")
-    print(f"📎 Total Attributes: {results['attribute_analysis']['total_attributes']:,}")
-    print(f"🔗 Total Links: {results['link_analysis']['summary']['total_links']}")
-    print(f"🖼️  Total Images: {results['image_analysis']['total_images']}")
-    print(f"📜 Total Scripts: {results['script_analysis']['total_scripts']}")
+    print(f"✅ Analysis Complete!", file=console)
+    print(f"📊 Total Statistics Generated: {meta['total_statistics_generated']:,}", file=console)
+    print(f"⏱️  Processing Time: {meta['processing_time']:.2f} seconds", file=console)
+    print(f"🏗️  Total Elements: {elements['total_elements']:,}", file=console)
+    print(f"🏷️  Unique Tags: {elements['unique_tags_count']}", file=console)
+    print(f"📎 Total Attributes: {total_attributes:,}", file=console)
+    print(f"🔗 Total Links: {total_links}", file=console)
+    print(f"🖼️  Total Images: {total_images}", file=console)
+    print(f"📜 Total Scripts: {total_scripts}", file=console)
     
     # Save to file if specified
     if output_file:
-        if format_type == 'json':
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-            print(f"💾 Results saved to: {output_file}")
-        elif format_type == 'text':
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(f"DOM Analyzer Report\n")
-                f.write(f"URL: {results['url']}\n")
-                f.write(f"Analysis Date: {results['meta_analysis']['analysis_timestamp']}\n")
-                f.write(f"Total Statistics: {results['meta_analysis']['total_statistics_generated']:,}\n\n")
-                
-                f.write("SUMMARY\n")
-                f.write("=" * 40 + "\n")
-                f.write(f"Total Elements: {results['element_analysis']['total_elements']:,}\n")
-                f.write(f"Unique Tags: {results['element_analysis']['unique_tags_count']}\n")
-                f.write(f"Total Attributes: {results['attribute_analysis']['total_attributes']:,}\n")
-                f.write(f"Total Links: {results['link_analysis']['summary']['total_links']}\n")
-                f.write(f"Total Images: {results['image_analysis']['total_images']}\n")
-                f.write(f"Total Scripts: {results['script_analysis']['total_scripts']}\n")
+        REPORT_WRITERS[format_type](results, output_file)
+
+
+def read_url_list(path: str) -> List[str]:
+    """Read one URL per line, skipping blank lines, # comments and duplicates"""
+    with open(path, encoding='utf-8') as f:
+        lines = (line.strip() for line in f)
+        return list(dict.fromkeys(line for line in lines if line and not line.startswith('#')))
+
+
+def to_ndjson_line(result: Dict[str, Any]) -> bytes:
+    """Encode one analysis result as a newline-terminated JSON line"""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+    return (json.dumps(result, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def run_batch_cli_mode(urls_file: str, output_file: str = None, jobs: int = BATCH_MAX_WORKERS):
+    """Analyze every URL in a file concurrently, writing one JSON result per line"""
+    try:
+        urls = read_url_list(urls_file)
+    except OSError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return
+    
+    if not urls:
+        print("❌ Error: No URLs provided", file=sys.stderr)
+        return
+    
+    jobs = min(jobs, len(urls))
+    
+    # Results go to stdout unless a file is given, so progress is reported on stderr
+    print(f"🔍 DOM Analyzer - Analyzing {len(urls)} URLs, {jobs} at a time", file=sys.stderr)
+    print("=" * 60, file=sys.stderr)
+    
+    to_file = output_file and output_file != STDOUT_PATH
+    out = open(output_file, 'wb') if to_file else sys.stdout.buffer
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # Line N of the output is the result for input URL N. Each result is written
+            # as soon as it and every earlier one are done, then released; detailed
+            # results are not kept by the analysis cache either
+            for result in executor.map(analyze_url, urls):
+                out.write(to_ndjson_line(result))
+                out.flush()
                 
-            print(f"📄 Text report saved to: {output_file}")
+                if 'error' in result:
+                    print(f"❌ {result['url']}: {result['error']}", file=sys.stderr)
+                else:
+                    print(f"✅ {result['url']}: {result['meta_analysis']['total_statistics_generated']:,} statistics",
+                          file=sys.stderr)
+    finally:
+        if to_file:
+            out.close()
+    
+    if to_file:
+        print(f"💾 Results saved to: {output_file}", file=sys.stderr)
 
 
 def main():
@@ -1382,12 +1834,18 @@ Examples:
   CLI Analysis:     python3 main.py --url https://www.google.com
   Save to JSON:     python3 main.py --url https://www.google.com --output results.json
   Save to Text:     python3 main.py --url https://www.google.com --output report.txt --format text
+  Batch to NDJSON:  python3 main.py --urls-file urls.txt --jobs 8 --output results.ndjson
         '''
     )
     
-    parser.add_argument('--url', help='URL to analyze')
-    parser.add_argument('--output', help='Output file path')
-    parser.add_argument('--format', choices=['json', 'text'], default='json', 
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--url', help='URL to analyze')
+    target.add_argument('--urls-file', help='File with one URL per line to analyze (writes NDJSON, in input order)')
+    parser.add_argument('--jobs', type=int,
+                       help=f'URLs analyzed concurrently with --urls-file, 1-{HTTP_POOL_SIZE} '
+                            f'(default: {BATCH_MAX_WORKERS})')
+    parser.add_argument('--output', help='Output file path ("-" for stdout)')
+    parser.add_argument('--format', choices=list(REPORT_WRITERS), default='json', 
                        help='Output format (default: json)')
     parser.add_argument('--port', type=int, default=5000, 
                        help='Port for web interface (default: 5000)')
@@ -1396,7 +1854,21 @@ Examples:
     
     args = parser.parse_args()
     
-    if args.url:
+    if args.jobs is not None and not args.urls_file:
+        parser.error('--jobs only applies to --urls-file')
+    if args.urls_file:
+        if args.format != 'json':
+            parser.error('--urls-file always writes NDJSON; --format text is not supported')
+        # More workers than pooled connections would churn connections per host
+        if args.jobs is None:
+            args.jobs = BATCH_MAX_WORKERS
+        elif not 1 <= args.jobs <= HTTP_POOL_SIZE:
+            parser.error(f'--jobs must be between 1 and {HTTP_POOL_SIZE}')
+    
+    if args.urls_file:
+        # Batch CLI Mode
+        run_batch_cli_mode(args.urls_file, args.output, args.jobs)
+    elif args.url:
         # CLI Mode
         run_cli_mode(args.url, args.output, args.format)
     else:
@@ -1410,6 +1882,8 @@ Examples:
         
         # Open browser automatically unless disabled
         if not args.no_browser:
+            import webbrowser
+            
             def open_browser():
                 time.sleep(1)  # Wait for server to start
                 webbrowser.open(f'http://localhost:{args.port}')